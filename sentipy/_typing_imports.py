@@ -10,24 +10,30 @@ PYTHON_AT_LEAST_3_9 = sys.version_info >= (3, 9)
 
 # Initialised first with Any to make mypy happy
 # See https://mypy.readthedocs.io/en/stable/common_issues.html#variables-vs-type-aliases
+AwaitableType: Any = None
 DictType: Any = None
+FrozenSetType: Any = None
 IterableType: Any = None
 ListType: Any = None
 SetType: Any = None
 TupleType: Any = None
 
 if PYTHON_AT_LEAST_3_9:
-    from collections.abc import Iterable
+    from collections.abc import Awaitable, Iterable
 
+    AwaitableType = Awaitable
     DictType = dict
+    FrozenSetType = frozenset
     IterableType = Iterable
     ListType = list
     SetType = set
     TupleType = tuple
 else:
-    from typing import Dict, Iterable, List, Set, Tuple
+    from typing import Awaitable, Dict, FrozenSet, Iterable, List, Set, Tuple
 
+    AwaitableType = Awaitable
     DictType = Dict
+    FrozenSetType = FrozenSet
     IterableType = Iterable
     ListType = List
     SetType = Set
@@ -1,11 +1,110 @@
+import asyncio
 import enum
 import json
-from typing import Optional, Union
+import math
+import threading
+import time
+from typing import Any, Optional, Union
 
 import requests
 from beartype import beartype
+from requests.adapters import HTTPAdapter
 
-from sentipy._typing_imports import DictType, JSONType, ListType, SetType, TupleType
+from sentipy._typing_imports import (
+    AwaitableType,
+    DictType,
+    FrozenSetType,
+    JSONType,
+    ListType,
+    SetType,
+    TupleType,
+)
+
+# Optional dependencies, see [[tool.mypy.overrides]] in pyproject.toml
+try:
+    import simdjson
+
+    _HAS_SIMDJSON = True
+except ImportError:
+    _HAS_SIMDJSON = False
+
+try:
+    import aiohttp
+
+    _HAS_AIOHTTP = True
+except ImportError:
+    _HAS_AIOHTTP = False
+
+try:
+    import numpy
+
+    _HAS_NUMPY = True
+except ImportError:
+    _HAS_NUMPY = False
+
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
+# The core metrics, in the order they are stored in array results
+_CORE_METRICS = ("sentiment", "AHI", "RHI", "SGP")
+_CORE_METRICS_DTYPE = [(metric, "f4") for metric in _CORE_METRICS]
+
+# simdjson parsers are not thread-safe, but reusing one per thread keeps its internal buffers allocated
+_local = threading.local()
+
+
+def _loads(content: bytes) -> Any:
+    """
+    Parse a JSON response body, using the fastest parser available.
+
+    Both simdjson and orjson work on the raw bytes, so the body never has to be decoded to a str.
+    All of the parsers raise a subclass of `ValueError` on invalid JSON.
+    """
+    if _HAS_SIMDJSON:
+        parser = getattr(_local, "parser", None)
+        if parser is None:
+            parser = _local.parser = simdjson.Parser()
+        # Convert fully to python objects, since lazy proxies are invalidated by the next parse
+        return parser.parse(content, recursive=True)
+    if _HAS_ORJSON:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _process_response(content: bytes, ok: bool) -> JSONType:
+    """
+    Parse the body of a response from the SentimentInvestor API
+
+    Args:
+        content (bytes): the raw response body
+        ok (bool): whether the response had a successful status code
+
+    Returns: the JSON response if the request was successful, otherwise an exception is raised.
+    """
+    try:
+        data = _loads(content)
+    except ValueError:
+        # Only non-JSON responses need to be checked against the plain text errors
+        if content in (b"invalid_parameter", b"incorrect_key"):
+            raise ValueError("Incorrect key or token")
+        raise Exception(content.decode("utf-8", errors="replace"))
+
+    if ok:
+        return data
+    else:
+        raise Exception(data["message"])
+
+
+def _core_metrics_row(dp: JSONType) -> TupleType[Any, ...]:
+    """
+    Get the symbol and core metrics of a stock, using NaN for any missing metrics
+    """
+    values = (dp.get(metric) for metric in _CORE_METRICS)
+    return (dp["symbol"], *(math.nan if v is None else v for v in values))
 
 
 class AccountTier(enum.Enum):
@@ -23,12 +122,10 @@ class _ApiResponse:
 
     @beartype
     def __init__(self, json: JSONType) -> None:
-        # for every metric returned in the json set it as an attribute for this object
-        for k, v in json.items():
-            # do not create a results parameter if present as this is handled by derived classes separately
-            if k == "results":
-                continue
-            setattr(self, k, v)
+        # set every metric returned in the json as an attribute for this object in one go
+        self.__dict__.update(json)
+        # do not keep a results parameter if present as this is handled by derived classes separately
+        self.__dict__.pop("results", None)
 
     def __repr__(self) -> str:
         return str(self.__dict__)
@@ -43,8 +140,7 @@ class _ApiResult(_ApiResponse):
     @beartype
     def __init__(self, json: JSONType) -> None:
         super().__init__(json)
-        for k, v in json.get("results").items():
-            setattr(self, k, v)
+        self.__dict__.update(json["results"])
 
 
 class Sentipy:
@@ -62,6 +158,19 @@ class Sentipy:
     The base URL of the SentimentInvestor API
     """
 
+    timeout = (3.05, 30)
+    """
+    The (connect, read) timeouts in seconds for requests to the SentimentInvestor API.
+    `all` only uses the connect timeout, as the API can take a long time to respond.
+
+    .. versionadded:: 2.1.0
+    """
+
+    all_stocks_ttl = 300.0
+    """
+    How long in seconds the list of supported stocks is cached for
+    """
+
     @beartype
     def __init__(self, token: str, key: str) -> None:
         """
@@ -82,9 +191,44 @@ class Sentipy:
         self.token = token
         self.key = key
 
+        # Reuse connections between requests to avoid a new TCP and TLS handshake each time
+        self._session = requests.Session()
+        self._session.mount(
+            "https://", HTTPAdapter(pool_connections=4, pool_maxsize=16)
+        )
+
+        self._all_stocks_cache: Optional[FrozenSetType[str]] = None
+        self._all_stocks_expiry = 0.0
+
+    @beartype
+    def close(self) -> None:
+        """
+        Close any open connections to the SentimentInvestor API
+
+        Examples:
+            >>> with Sentipy(token=token, key=key) as sentipy:
+            ...     print(sentipy.parsed("AAPL").AHI)
+            ...
+            0.8478140394088669
+
+        .. versionadded:: 2.1.0
+        """
+        self._session.close()
+
+    def __enter__(self) -> "Sentipy":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
     @beartype
     def _base_request(
-        self, endpoint: str, params: Optional[JSONType] = None
+        self,
+        endpoint: str,
+        params: Optional[JSONType] = None,
+        timeout: Optional[
+            TupleType[Union[int, float], Optional[Union[int, float]]]
+        ] = None,
     ) -> JSONType:
         """
         Make a request to a specific REST endpoint on the SentimentInvestor API
@@ -92,31 +236,35 @@ class Sentipy:
         Args:
             endpoint (str): the REST endpoint (final fragment in URL)
             params (dict): any supplementary parameters to pass to the API
+            timeout (tuple): the (connect, read) timeouts to use instead of `Sentipy.timeout`
 
         Returns: the JSON response if the request was successful, otherwise an exception is raised.
 
         """
-        if params is None:
-            params = {}
         url = self.base_url + endpoint
-        params["token"] = self.token
-        params["key"] = self.key
-        response = requests.get(url, params)
-        if (
-            response.content.decode("utf-8") == "invalid_parameter"
-            or response.content.decode("utf-8") == "incorrect_key"
-        ):
-            raise ValueError("Incorrect key or token")
-        else:
-            try:
-                data = response.json()
-            except json.JSONDecodeError:
-                raise Exception(response.text)
+        params = {**(params or {}), "token": self.token, "key": self.key}
+        if timeout is None:
+            timeout = self.timeout
+        response = self._session.get(url, params=params, timeout=timeout)
+        return _process_response(response.content, response.ok)
+
+    async def _aget(
+        self, session: "aiohttp.ClientSession", endpoint: str, params: JSONType
+    ) -> JSONType:
+        """
+        Asynchronously make a request to a specific REST endpoint on the SentimentInvestor API
 
-            if response.ok:
-                return data
-            else:
-                raise Exception(data["message"])
+        Args:
+            session (aiohttp.ClientSession): the session to make the request with
+            endpoint (str): the REST endpoint (final fragment in URL)
+            params (dict): any supplementary parameters to pass to the API
+
+        Returns: the JSON response if the request was successful, otherwise an exception is raised.
+        """
+        params = {**params, "token": self.token, "key": self.key}
+        async with session.get(self.base_url + endpoint, params=params) as response:
+            content = await response.read()
+            return _process_response(content, response.status < 400)
 
     @beartype
     def parsed(self, symbol: str) -> _ApiResult:
@@ -204,6 +352,77 @@ class Sentipy:
         params = {"symbol": symbol, "enrich": enrich}
         return _ApiResult(self._base_request("quote", params=params))
 
+    @beartype
+    def quote_many(
+        self, symbols: ListType[str], enrich: bool = False
+    ) -> AwaitableType[ListType[_ApiResult]]:
+        """
+        Concurrently request quote data for several stocks.
+
+        Requires [aiohttp](https://docs.aiohttp.org/) to be installed.
+
+        Args:
+            symbols (list): tickers or symbols of the stocks to request data for
+            enrich (bool): whether to request enriched data
+
+        Returns: an awaitable list of QuoteData objects, in the same order as `symbols`
+
+        Raises:
+            `ImportError` if aiohttp is not installed
+
+        Examples:
+            >>> quotes = await sentipy.quote_many(["AAPL", "TSLA"])
+            >>> print([quote.symbol for quote in quotes])
+            ['AAPL', 'TSLA']
+
+        .. versionadded:: 2.1.0
+        """
+        # Not a coroutine function itself, since beartype can only check the arguments of normal functions
+        if not _HAS_AIOHTTP:
+            raise ImportError("aiohttp is required for asynchronous requests")
+        return self._quote_many(symbols, enrich)
+
+    async def _quote_many(
+        self, symbols: ListType[str], enrich: bool
+    ) -> ListType[_ApiResult]:
+        # A session belongs to the event loop it was created in, so use a new one for each call
+        async with aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=32, ttl_dns_cache=300),
+            timeout=aiohttp.ClientTimeout(
+                sock_connect=self.timeout[0], sock_read=self.timeout[1]
+            ),
+        ) as session:
+            # aiohttp only accepts str, int and float parameters
+            responses = await asyncio.gather(
+                *(
+                    self._aget(
+                        session, "quote", {"symbol": symbol, "enrich": str(enrich)}
+                    )
+                    for symbol in symbols
+                )
+            )
+        return [_ApiResult(response) for response in responses]
+
+    @beartype
+    def quote_many_sync(
+        self, symbols: ListType[str], enrich: bool = False
+    ) -> ListType[_ApiResult]:
+        """
+        Blocking version of `quote_many`, for use outside of an event loop
+
+        Args:
+            symbols (list): tickers or symbols of the stocks to request data for
+            enrich (bool): whether to request enriched data
+
+        Returns: a list of QuoteData objects, in the same order as `symbols`
+
+        Raises:
+            `ImportError` if aiohttp is not installed
+
+        .. versionadded:: 2.1.0
+        """
+        return asyncio.run(self.quote_many(symbols, enrich))
+
     @beartype
     def sort(self, metric: str, limit: int) -> ListType[_ApiResponse]:
         """
@@ -230,9 +449,43 @@ class Sentipy:
         params = {"metric": metric, "limit": limit}
         return [
             _ApiResponse(dp)
-            for dp in self._base_request("sort", params=params).get("results")
+            for dp in self._base_request("sort", params=params)["results"]
         ]
 
+    @beartype
+    def sort_array(self, metric: str, limit: int) -> "numpy.ndarray":
+        """
+        Like `sort`, but returns the core metrics as a NumPy structured array.
+
+        This is much more compact than a list of TickerData objects, and can be used directly
+        with vectorised NumPy operations. Missing metrics are stored as NaN.
+        Requires [NumPy](https://numpy.org/) to be installed.
+
+        Args:
+            metric (str): the metric by which to sort the stocks
+            limit (int): the maximum number of stocks to return
+
+        Returns: an array with the fields `symbol`, `sentiment`, `AHI`, `RHI` and `SGP`
+
+        Examples:
+            >>> sort_data = sentipy.sort_array("AHI", 4)
+            >>> print(sort_data["symbol"][sort_data["sentiment"] > 0.75])
+            ['ET' 'AAPL']
+
+        .. versionadded:: 2.1.0
+        """
+        if not _HAS_NUMPY:
+            raise ImportError("numpy is required for array results")
+        params = {"metric": metric, "limit": limit}
+        results = self._base_request("sort", params=params)["results"]
+        # Size the symbol field to fit the longest symbol, as NumPy would silently truncate it
+        symbol_length = max((len(dp["symbol"]) for dp in results), default=1)
+        return numpy.fromiter(
+            (_core_metrics_row(dp) for dp in results),
+            dtype=[("symbol", f"U{symbol_length}")] + _CORE_METRICS_DTYPE,
+            count=len(results),
+        )
+
     @beartype
     def historical(
         self, symbol: str, metric: str, start: int, end: int
@@ -260,10 +513,55 @@ class Sentipy:
 
         """
         params = {"symbol": symbol, "metric": metric, "start": start, "end": end}
-        return {
-            dp.get("timestamp"): dp.get("data")
-            for dp in self._base_request("historical", params=params).get("results")
-        }
+        results = self._base_request("historical", params=params)["results"]
+        # Every data point has both keys, so index directly rather than calling .get
+        timestamps = [dp["timestamp"] for dp in results]
+        values = [dp["data"] for dp in results]
+        return dict(zip(timestamps, values))
+
+    @beartype
+    def historical_array(
+        self, symbol: str, metric: str, start: int, end: int
+    ) -> TupleType["numpy.ndarray", "numpy.ndarray"]:
+        """
+        Like `historical`, but returns the data as a pair of NumPy arrays sorted by timestamp.
+        As with `historical`, only the last data entry is kept for a repeated timestamp.
+
+        Requires [NumPy](https://numpy.org/) to be installed.
+
+        Args:
+            symbol (str): the stock to look up historical data for
+            metric (str): the metric for which to return data
+            start (int): Unix epoch timestamp in seconds specifying start of date range
+            end (int): Unix epoch timestamp in seconds specifying end of date range
+
+        Returns (tuple): `float64` arrays of the timestamps and their corresponding data entries.
+
+        Examples:
+            >>> timestamps, values = sentipy.historical_array("AAPL", "RHI", 1614556869, 1619654469)
+            >>> print(timestamps[:3], values[:3])
+            [1.61805717e+09 1.61833617e+09 1.61833861e+09] [5.93845051e-05 4.62461346e-04 5.78009855e-04]
+
+        .. versionadded:: 2.1.0
+        """
+        if not _HAS_NUMPY:
+            raise ImportError("numpy is required for array results")
+        params = {"symbol": symbol, "metric": metric, "start": start, "end": end}
+        results = self._base_request("historical", params=params)["results"]
+        count = len(results)
+        timestamps = numpy.fromiter(
+            (dp["timestamp"] for dp in results), dtype=numpy.float64, count=count
+        )
+        values = numpy.fromiter(
+            (dp["data"] for dp in results), dtype=numpy.float64, count=count
+        )
+        if count == 0:
+            return timestamps, values
+        order = numpy.argsort(timestamps, kind="stable")
+        timestamps, values = timestamps[order], values[order]
+        # The sort is stable, so the last of each run of equal timestamps is the one historical keeps
+        last = numpy.append(timestamps[1:] != timestamps[:-1], True)
+        return timestamps[last], values[last]
 
     @beartype
     def bulk(
@@ -283,7 +581,7 @@ class Sentipy:
         params = {"symbols": ",".join(symbols), "enrich": enrich}
         return [
             _ApiResponse(result)
-            for result in self._base_request("bulk", params=params).get("results")
+            for result in self._base_request("bulk", params=params)["results"]
         ]
 
     @beartype
@@ -301,10 +599,11 @@ class Sentipy:
         .. versionadded:: 2.0.0
         """
         params = {"enrich": enrich}
-        return [
-            _ApiResponse(result)
-            for result in self._base_request("all", params=params).get("results")
-        ]
+        # Only time out while connecting, since the response can take a long time
+        response = self._base_request(
+            "all", params=params, timeout=(self.timeout[0], None)
+        )
+        return [_ApiResponse(result) for result in response["results"]]
 
     @beartype
     def supported(self, symbol: str) -> bool:
@@ -325,9 +624,18 @@ class Sentipy:
             SNTPY is not supported.
 
         .. versionadded:: 2.0.0
+        .. versionchanged:: 2.1.0
+           Symbols returned by `all_stocks` within the last `all_stocks_ttl` seconds are answered without a request.
         """
+        # Only trust hits, as the API may also accept symbols that don't exactly match the cache
+        if (
+            self._all_stocks_cache is not None
+            and time.monotonic() < self._all_stocks_expiry
+            and symbol in self._all_stocks_cache
+        ):
+            return True
         # Assume results always returns a bool
-        return self._base_request("supported", params={"symbol": symbol}).get("results")  # type: ignore[no-any-return]
+        return self._base_request("supported", params={"symbol": symbol})["results"]  # type: ignore[no-any-return]
 
     @beartype
     def all_stocks(self) -> SetType[str]:
@@ -337,8 +645,17 @@ class Sentipy:
         Returns (set[str]): list of stock symbols
 
         .. versionadded:: 2.0.0
+        .. versionchanged:: 2.1.0
+           The list is cached for `all_stocks_ttl` seconds.
         """
-        return set(self._base_request("all-stocks").get("results"))
+        now = time.monotonic()
+        if self._all_stocks_cache is None or now >= self._all_stocks_expiry:
+            self._all_stocks_cache = frozenset(
+                self._base_request("all-stocks")["results"]
+            )
+            self._all_stocks_expiry = now + self.all_stocks_ttl
+        # Return a copy so that callers can't modify the cache
+        return set(self._all_stocks_cache)
 
     # mypy doesn't support decorated properties
     @property  # type: ignore[misc]
@@ -1,5 +1,7 @@
+import asyncio
 import os
 import unittest
+from unittest import mock
 
 # vcrpy is untyped
 # Therefore, ignore all vcr decorators
@@ -7,7 +9,15 @@ import vcr  # type: ignore[import]
 from beartype import beartype
 
 from sentipy._typing_imports import DictType, ListType
-from sentipy.sentipy import Sentipy
+from sentipy.sentipy import (
+    _HAS_AIOHTTP,
+    _HAS_NUMPY,
+    _HAS_ORJSON,
+    _HAS_SIMDJSON,
+    Sentipy,
+    _loads,
+    _process_response,
+)
 
 
 class SentipyTestCase(unittest.TestCase):
@@ -125,6 +135,206 @@ class SentipyTestCase(unittest.TestCase):
                 ],
             )
 
+    @unittest.skipUnless(_HAS_AIOHTTP, "aiohttp is not installed")
+    @vcr.use_cassette("vcr_cassettes/quote_many.yml")  # type: ignore[misc]
+    @beartype
+    def test_quote_many(self) -> None:
+        symbols = ["AAPL", "TSLA", "PYPL"]
+        # Each call runs on a separate event loop
+        for _ in range(2):
+            data = asyncio.run(self.sentipy.quote_many(symbols))
+            self.assertEqual([stock.symbol for stock in data], symbols)
+            for stock in data:
+                self.check_basics(stock)
+                self.assertHasAttrs(stock, ["sentiment", "AHI", "RHI", "SGP"])
+
+    @unittest.skipUnless(_HAS_AIOHTTP, "aiohttp is not installed")
+    @vcr.use_cassette("vcr_cassettes/quote_many_sync.yml")  # type: ignore[misc]
+    @beartype
+    def test_quote_many_sync(self) -> None:
+        symbols = ["AAPL", "TSLA"]
+        data = self.sentipy.quote_many_sync(symbols)
+        self.assertEqual([stock.symbol for stock in data], symbols)
+        for stock in data:
+            self.check_basics(stock)
+
+    @unittest.skipUnless(_HAS_NUMPY, "numpy is not installed")
+    @vcr.use_cassette("vcr_cassettes/sort_array.yml")  # type: ignore[misc]
+    @beartype
+    def test_sort_array(self) -> None:
+        data = self.sentipy.sort_array("AHI", 4)
+        self.assertEqual(len(data), 4)
+        self.assertEqual(data.dtype.names, ("symbol", "sentiment", "AHI", "RHI", "SGP"))
+        # Sorted by AHI in descending order
+        self.assertTrue((data["AHI"][:-1] >= data["AHI"][1:]).all())
+
+    @unittest.skipUnless(_HAS_NUMPY, "numpy is not installed")
+    @vcr.use_cassette("vcr_cassettes/historical_array.yml")  # type: ignore[misc]
+    @beartype
+    def test_historical_array(self) -> None:
+        timestamps, values = self.sentipy.historical_array(
+            "AAPL", "RHI", 1614556869, 1619654469
+        )
+        self.assertEqual(len(timestamps), len(values))
+        self.assertTrue((timestamps[:-1] < timestamps[1:]).all())
+
+
+class ParsingTestCase(unittest.TestCase):
+    @beartype
+    def check_loads(self) -> None:
+        self.assertEqual(
+            _loads(b'{"symbol": "AAPL", "results": [1, 2.5, null]}'),
+            {"symbol": "AAPL", "results": [1, 2.5, None]},
+        )
+        with self.assertRaises(ValueError):
+            _loads(b"incorrect_key")
+
+    @unittest.skipUnless(_HAS_SIMDJSON, "simdjson is not installed")
+    @beartype
+    def test_loads_simdjson(self) -> None:
+        self.check_loads()
+
+    @unittest.skipUnless(_HAS_ORJSON, "orjson is not installed")
+    @beartype
+    def test_loads_orjson(self) -> None:
+        with mock.patch("sentipy.sentipy._HAS_SIMDJSON", False):
+            self.check_loads()
+
+    @beartype
+    def test_loads_stdlib(self) -> None:
+        with mock.patch("sentipy.sentipy._HAS_SIMDJSON", False), mock.patch(
+            "sentipy.sentipy._HAS_ORJSON", False
+        ):
+            self.check_loads()
+
+    @beartype
+    def test_process_response_ok(self) -> None:
+        self.assertEqual(
+            _process_response(b'{"success": true, "results": true}', True),
+            {"success": True, "results": True},
+        )
+
+    @beartype
+    def test_process_response_incorrect_credentials(self) -> None:
+        for content in [b"invalid_parameter", b"incorrect_key"]:
+            with self.subTest(content=content):
+                with self.assertRaisesRegex(ValueError, "Incorrect key or token"):
+                    _process_response(content, False)
+
+    @beartype
+    def test_process_response_not_json(self) -> None:
+        with self.assertRaisesRegex(Exception, "^Internal Server Error$"):
+            _process_response(b"Internal Server Error", False)
+
+    @beartype
+    def test_process_response_error_message(self) -> None:
+        with self.assertRaisesRegex(Exception, "^Symbol not found$"):
+            _process_response(
+                b'{"success": false, "message": "Symbol not found"}', False
+            )
+
+
+class RequestTestCase(unittest.TestCase):
+    sentipy: Sentipy
+
+    @beartype
+    def setUp(self) -> None:
+        self.sentipy = Sentipy(token="token", key="key")
+        patcher = mock.patch.object(self.sentipy._session, "get")
+        self.get = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.get.return_value.ok = True
+        self.get.return_value.content = b'{"success": true, "results": []}'
+
+    @beartype
+    def test_credentials(self) -> None:
+        self.sentipy.token = "new-token"
+        self.sentipy.all_stocks()
+        self.assertEqual(
+            self.get.call_args.kwargs["params"], {"token": "new-token", "key": "key"}
+        )
+
+    @beartype
+    def test_all_timeout(self) -> None:
+        self.sentipy.all()
+        self.assertEqual(
+            self.get.call_args.kwargs["timeout"], (self.sentipy.timeout[0], None)
+        )
+
+    @beartype
+    def test_context_manager(self) -> None:
+        with mock.patch.object(self.sentipy._session, "close") as close:
+            with self.sentipy as sentipy:
+                self.assertIs(sentipy, self.sentipy)
+            close.assert_called_once()
+
+    @unittest.skipUnless(_HAS_NUMPY, "numpy is not installed")
+    @beartype
+    def test_sort_array_long_symbol(self) -> None:
+        self.get.return_value.content = (
+            b'{"success": true, "results": ['
+            b'{"symbol": "LONGSYMBOLXX", "AHI": 2.0}, {"symbol": "AMC", "AHI": 1.0}'
+            b"]}"
+        )
+        data = self.sentipy.sort_array("AHI", 2)
+        self.assertEqual(list(data["symbol"]), ["LONGSYMBOLXX", "AMC"])
+        self.assertEqual(list(data["AHI"]), [2.0, 1.0])
+
+    @unittest.skipUnless(_HAS_NUMPY, "numpy is not installed")
+    @beartype
+    def test_historical_array_matches_historical(self) -> None:
+        self.get.return_value.content = (
+            b'{"success": true, "results": ['
+            b'{"timestamp": 3, "data": 1.0}, {"timestamp": 1, "data": 2.0},'
+            b'{"timestamp": 1, "data": 5.0}'
+            b"]}"
+        )
+        timestamps, values = self.sentipy.historical_array("AAPL", "RHI", 0, 4)
+        self.assertEqual(
+            dict(zip(timestamps, values)),
+            self.sentipy.historical("AAPL", "RHI", 0, 4),
+        )
+        self.assertEqual(list(timestamps), [1.0, 3.0])
+
+    @unittest.skipUnless(_HAS_NUMPY, "numpy is not installed")
+    @beartype
+    def test_historical_array_empty(self) -> None:
+        timestamps, values = self.sentipy.historical_array("AAPL", "RHI", 0, 4)
+        self.assertEqual((len(timestamps), len(values)), (0, 0))
+        self.assertEqual(self.sentipy.historical("AAPL", "RHI", 0, 4), {})
+
+    @beartype
+    def test_supported_cache(self) -> None:
+        self.get.return_value.content = (
+            b'{"success": true, "results": ["AAPL", "TSLA"]}'
+        )
+        with mock.patch("sentipy.sentipy.time.monotonic", return_value=1000.0):
+            self.assertEqual(self.sentipy.all_stocks(), {"AAPL", "TSLA"})
+            self.assertEqual(self.get.call_count, 1)
+            # Answered from the cache without another request
+            self.assertTrue(self.sentipy.supported("AAPL"))
+            self.assertEqual(self.get.call_count, 1)
+
+            # Misses are still checked with the API, which may normalise the symbol
+            self.get.return_value.content = b'{"success": true, "results": true}'
+            self.assertTrue(self.sentipy.supported("aapl"))
+            self.assertEqual(self.get.call_count, 2)
+            self.get.return_value.content = b'{"success": true, "results": false}'
+            self.assertFalse(self.sentipy.supported("SNTPY"))
+            self.assertEqual(self.get.call_count, 3)
+
+        self.get.return_value.content = b'{"success": true, "results": true}'
+        expired = 1000.0 + self.sentipy.all_stocks_ttl
+        with mock.patch("sentipy.sentipy.time.monotonic", return_value=expired):
+            self.assertTrue(self.sentipy.supported("AAPL"))
+            self.assertEqual(self.get.call_count, 4)
+
+    @beartype
+    def test_quote_many_rejects_str(self) -> None:
+        # A str is an iterable of symbols, but would request each character
+        with self.assertRaisesRegex(Exception, "symbols"):
+            self.sentipy.quote_many("AAPL")  # type: ignore[arg-type]
+
 
 if __name__ == "__main__":
     unittest.main()